@@ -4,10 +4,15 @@
 #------------------------------------------------------------------------------
 """ A testcase mixin to help with automated application testing. """
 
+import errno
 import os
+import select
+import shlex
 import subprocess
 import time
 
+DEVNULL = subprocess.DEVNULL
+
 
 class ApplicationTestAssistant(object):
     """ A mixin to help with automated GUI testing.
@@ -43,7 +48,7 @@ class ApplicationTestAssistant(object):
             msg = 'Process "{}" still exists'.format(process.pid)
         returncode = process.poll()
         if returncode is None:
-            time.sleep(timeout)
+            _wait_for_exit(process.pid, timeout)
             returncode = process.poll()
 
         self.assertIsNotNone(returncode, msg=msg)
@@ -94,27 +99,46 @@ class ApplicationTestAssistant(object):
 
     ### Common tasks methods ################################################
 
-    def start_application(self, command, stdout=None, stderr=None):
+    def start_application(self, command, stdout=None, stderr=None,
+                          new_session=False):
         """ Start the application!
 
         Starts and return the process that the application was started in.
         The stdout and stderr of the child process is redirected to the
         provided stream (default is to suppress).
 
+        The child is started with all other file descriptors closed. No
+        pre-exec hooks are used, which lets CPython start the child with
+        vfork instead of copying the page tables of a (possibly large) test
+        process.
+
          Parameters
          ----------
-         command : str
-             The command to execute on the shell to run the application.
+         command : str or list
+             The command to execute to run the application. On POSIX a
+             string is split into arguments using shell syntax.
          stdout :
              The stream to use for standard output. Default is os.devnull
          strerr :
              The stream to use for standard error. Default is os.devnull
+         new_session : bool
+             Start the application in a new session (POSIX only). Signals
+             sent to the process group of the test runner (e.g. Ctrl-C) do
+             not reach the application, so the caller is responsible for
+             terminating it. Default is False.
 
         """
-        devnull = open(os.devnull, 'w')
-        stdout = devnull if stdout is None else stdout
-        stderr = devnull if stderr is None else stderr
-        return subprocess.Popen(args=command, stdout=stdout, stderr=stderr)
+        stdout = DEVNULL if stdout is None else stdout
+        stderr = DEVNULL if stderr is None else stderr
+        if os.name == 'posix' and isinstance(command, str):
+            command = shlex.split(command)
+        return subprocess.Popen(
+            args=command,
+            stdout=stdout,
+            stderr=stderr,
+            close_fds=True,
+            start_new_session=new_session,
+        )
 
     def close_window(self, window_assistant):
         """ Close the window and assert that it does not exist anymore.
@@ -127,3 +151,50 @@ class ApplicationTestAssistant(object):
         """
         window_assistant.close()
         self.assertWindowDoesNotExist(window_assistant)
+
+
+def _wait_for_exit(pid, timeout):
+    """ Block until the process with the given pid exits or the timeout
+    expires.
+
+    The kernel is asked to notify us of the process exit (a pidfd on Linux,
+    a kqueue ``NOTE_EXIT`` filter on macOS/BSD) so that we return as soon as
+    the process is gone. When neither is available we fall back to sleeping
+    for the full timeout.
+
+    """
+    if hasattr(os, 'pidfd_open'):
+        try:
+            fd = os.pidfd_open(pid)
+        except OSError as error:
+            if error.errno == errno.ESRCH:
+                return
+            if error.errno != errno.ENOSYS:
+                raise
+        else:
+            try:
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                poller.poll(timeout * 1000)
+            finally:
+                os.close(fd)
+            return
+    elif hasattr(select, 'kqueue'):
+        kq = select.kqueue()
+        try:
+            event = select.kevent(
+                pid,
+                filter=select.KQ_FILTER_PROC,
+                flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                fflags=select.KQ_NOTE_EXIT,
+            )
+            try:
+                kq.control([event], 1, timeout)
+            except OSError as error:
+                if error.errno == errno.ESRCH:
+                    return
+                raise
+        finally:
+            kq.close()
+        return
+    time.sleep(timeout)
@@ -2,6 +2,21 @@
 #  Copyright (c) 2013, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+import threading
+import time
+
+try:
+    from pywinauto import findwindows
+    from pywinauto.application import WindowSpecification
+    from pywinauto.timings import Timings
+except ImportError:
+    findwindows = WindowSpecification = Timings = None
+
+try:
+    from comtypes import COMObject
+    from pywinauto.uia_defines import IUIA
+except ImportError:
+    COMObject = IUIA = None
 
 
 class WindowAssistant(object):
@@ -28,11 +43,17 @@ class WindowAssistant(object):
             can be overridden in some of the methods.
 
         """
-        from pywinauto.application import WindowSpecification
-
+        if WindowSpecification is None:
+            raise ImportError('WindowAssistant requires pywinauto')
         self.window_spec = WindowSpecification(criteria)
         self.actions = {} if actions is None else actions
         self.timeout = timeout
+        self._closed_event = None
+        self._closed_handler = None
+        self._handle = None
+        self._cache_request = None
+        self._cached_element = None
+        self._cached_time = None
 
     @property
     def window(self):
@@ -46,7 +67,10 @@ class WindowAssistant(object):
     def title(self):
         """ Return the title of the window.
         """
-        return self.window.WindowText()
+        element = self._element()
+        if element is None:
+            return self.window.WindowText()
+        return element.CachedName
 
     def invoke_action(self, action):
         """ Execute the action in the specified window.
@@ -70,9 +94,9 @@ class WindowAssistant(object):
 
         """
         timeout = self.timeout if timeout is None else timeout
-        self.window_spec.Wait('exists', timeout=timeout)
+        self._cached_element = None
+        self.window_spec.Wait('exists ready', timeout=timeout)
         self.window.SetFocus()
-        self.window_spec.Wait('ready', timeout=timeout)
 
     def type_key_sequence(self, key_sequence, with_spaces=False):
         """ Send the key sequence in the Window.
@@ -88,6 +112,7 @@ class WindowAssistant(object):
 
         """
         self.window.TypeKeys(key_sequence, with_spaces=with_spaces)
+        self._cached_element = None
 
     def click(self, button='left', position=(None, None)):
         """ Simulate a mouse click in the window.
@@ -103,6 +128,7 @@ class WindowAssistant(object):
         """
         self.set_focus()
         self.window.ClickInput(button=button, double=False, coords=position)
+        self._cached_element = None
 
     def doubleclick(self, button='left', position=(None, None),):
         """ Simulate a mouse double-click in the window area
@@ -118,6 +144,7 @@ class WindowAssistant(object):
         """
         self.set_focus()
         self.window.ClickInput(button=button, double=True, coords=position)
+        self._cached_element = None
 
     def exists(self, timeout=None):
         """ Return true if the window exists.
@@ -141,6 +168,22 @@ class WindowAssistant(object):
 
         """
         timeout = self.timeout if timeout is None else timeout
+        if not self.window_spec.Exists(0):
+            return True
+        subscribed = self._closed_event is None
+        closed_event = self._watch_closed()
+        if closed_event is not None:
+            if timeout is None:
+                timeout = Timings.window_find_timeout
+            try:
+                # The window might have closed before we subscribed.
+                if closed_event.wait(0) or not self.window_spec.Exists(0):
+                    return True
+                closed = closed_event.wait(timeout)
+                return closed or not self.window_spec.Exists(0)
+            finally:
+                if subscribed:
+                    self._unwatch_closed()
         try:
             self.window_spec.WaitNot('exists', timeout=timeout)
         except RuntimeError:
@@ -157,5 +200,131 @@ class WindowAssistant(object):
 
         """
         timeout = self.timeout if timeout is None else timeout
-        self.window.Close()
-        self.does_not_exist(timeout)
+        self._cached_element = None
+        self._watch_closed()
+        try:
+            self.window.Close()
+            self.does_not_exist(timeout)
+        finally:
+            self._unwatch_closed()
+            self._handle = None
+
+    ### Private methods #####################################################
+
+    def _element(self, ttl=0.05):
+        """ Return the UIA element of the window with its name prefetched.
+
+        The element is built with a single ElementFromHandleBuildCache call
+        on the known window handle and reused for `ttl` seconds or until
+        invalidated, so that reading the cached name does not require a
+        round-trip to the target application. Returns None if UIA is not
+        available or the element cannot be built.
+
+        """
+        if IUIA is None:
+            return None
+        if self._cached_element is not None:
+            if time.monotonic() - self._cached_time > ttl:
+                self._cached_element = None
+        if self._cached_element is None:
+            try:
+                uia = IUIA()
+                if self._cache_request is None:
+                    request = uia.iuia.CreateCacheRequest()
+                    request.AddProperty(uia.UIA_dll.UIA_NamePropertyId)
+                    request.TreeScope = uia.UIA_dll.TreeScope_Element
+                    self._cache_request = request
+                self._cached_element = uia.iuia.ElementFromHandleBuildCache(
+                    self._window_handle(), self._cache_request)
+                self._cached_time = time.monotonic()
+            except Exception:
+                # The handle might belong to a window that has been closed.
+                self._handle = None
+                return None
+        return self._cached_element
+
+    def _watch_closed(self):
+        """ Subscribe to the UIA window closed event of the window.
+
+        Returns the :class:`threading.Event` that is set when the window
+        closes, or None if the event handler could not be registered (e.g.
+        UIA is not available or the window does not exist).
+
+        """
+        if self._closed_event is not None:
+            return self._closed_event
+        if IUIA is None:
+            return None
+        try:
+            uia = IUIA()
+            element = uia.iuia.ElementFromHandle(self._window_handle())
+            closed_event = threading.Event()
+            handler = _window_closed_handler(closed_event)
+            uia.iuia.AddAutomationEventHandler(
+                uia.UIA_dll.UIA_Window_WindowClosedEventId,
+                element,
+                uia.UIA_dll.TreeScope_Element,
+                None,
+                handler,
+            )
+        except Exception:
+            # The handle might belong to a window that has been closed.
+            self._handle = None
+            return None
+        self._closed_event = closed_event
+        self._closed_handler = (element, handler)
+        return closed_event
+
+    def _window_handle(self):
+        """ Return the handle of the window.
+
+        The handle is looked up once and reused. Unlike :attr:`window`, the
+        lookup does not wait for the window to appear and raises immediately
+        if the window does not exist.
+
+        """
+        if self._handle is None:
+            criteria = self.window_spec.criteria[0]
+            self._handle = findwindows.find_element(**criteria).handle
+        return self._handle
+
+    def _unwatch_closed(self):
+        """ Remove the UIA window closed event handler (if any).
+
+        """
+        if self._closed_handler is None:
+            return
+        element, handler = self._closed_handler
+        self._closed_event = None
+        self._closed_handler = None
+        try:
+            uia = IUIA()
+            uia.iuia.RemoveAutomationEventHandler(
+                uia.UIA_dll.UIA_Window_WindowClosedEventId, element, handler)
+        except Exception:
+            pass
+
+
+_WindowClosedHandler = None
+
+
+def _window_closed_handler(closed_event):
+    """ Create a UIA automation event handler that sets `closed_event`.
+
+    """
+    global _WindowClosedHandler
+    if _WindowClosedHandler is None:
+
+        class WindowClosedHandler(COMObject):
+
+            _com_interfaces_ = [IUIA().UIA_dll.IUIAutomationEventHandler]
+
+            def __init__(self, closed_event):
+                super(WindowClosedHandler, self).__init__()
+                self.closed_event = closed_event
+
+            def HandleAutomationEvent(self, sender, event_id):
+                self.closed_event.set()
+
+        _WindowClosedHandler = WindowClosedHandler
+    return _WindowClosedHandler(closed_event)
@@ -2,13 +2,21 @@
 #  Copyright (c) 2013, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+import functools
 import gc
+import multiprocessing
 import os
-from multiprocessing import Process
-from multiprocessing.queues import Queue
+import sys
+from itertools import repeat
+from queue import Empty
 
 import psutil
 
+if sys.platform.startswith('linux'):
+    _PAGESIZE = os.sysconf('SC_PAGE_SIZE')
+else:
+    _PAGESIZE = None
+
 
 class MemoryLeakAssistant(object):
     """ Assistant methods used to assert against memory leaks in unittests.
@@ -45,7 +53,7 @@ class MemoryLeakAssistant(object):
             raise AssertionError(msg)
 
     def assertReturnsMemory(self, function, args=None, iterations=100,
-                            slack=0.0, msg=None):
+                            slack=0.0, msg=None, sample_every=10):
         """ Assert that the function does not retain memory over a number of
         runs.
 
@@ -62,6 +70,16 @@ class MemoryLeakAssistant(object):
         slack : float
             The percentage (relative to the first run) that we allow the
             process memory usage to exceed the expected. The default is 0.0
+        sample_every : int
+            The number of iterations between memory usage checks. A full
+            garbage collection is only run before each check, the youngest
+            generation is collected after every iteration. The last
+            iteration is always checked. Default is 10.
+
+        Raises
+        ------
+        ValueError :
+            if `sample_every` is less than 1.
 
         Note
         ----
@@ -70,27 +88,35 @@ class MemoryLeakAssistant(object):
         running test suite.
 
         """
+        if sample_every < 1:
+            raise ValueError(
+                'sample_every should be at least 1, got {}'.format(
+                    sample_every))
         process = psutil.Process(os.getpid())
-
-        def test_function():
-            if args is None:
-                function()
-            else:
-                function(*args)
+        if args is None:
+            call = function
+        else:
+            call = functools.partial(function, *args)
 
         gc.collect()
         baseline = self._memory_usage(process)
 
+        count = 0
         try:
-            for index in xrange(iterations):
-                test_function()
+            while count < iterations:
+                batch = min(sample_every, iterations - count)
+                for _ in repeat(None, batch - 1):
+                    call()
+                    gc.collect(0)
+                call()
+                count += batch
                 gc.collect()
                 self.assertMemoryUsage(process, baseline, slack=slack)
         except AssertionError:
             leak = (self._memory_usage(process) - baseline) / baseline
             if msg is None:
                 msg = "Memory leak of {:.2%} after {} iterations"
-                raise AssertionError(msg.format(leak, index + 1))
+                raise AssertionError(msg.format(leak, count))
             else:
                 raise AssertionError(msg)
 
@@ -107,21 +133,33 @@ class MemoryLeakAssistant(object):
             memory. In such a case the method returns the exception traceback.
 
         """
-        queue = Queue()
-        process = Process(
-            target=self._subprocess_runner(),
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+        else:
+            context = multiprocessing.get_context()
+        queue = context.Queue()
+        process = context.Process(
+            target=_check_for_memory_leak,
             args=(function, iterations, slack, queue, args)
         )
         self._assertChildProcessFinishes(process, queue)
 
     def _memory_usage(self, process):
-        return float(process.get_memory_info().rss)
+        if _PAGESIZE is not None:
+            rss = _statm_rss(process.pid)
+            if rss is not None:
+                return float(rss)
+        return float(process.memory_info().rss)
 
     def _assertChildProcessFinishes(self, process, queue):
         try:
             process.start()
             process.join()
-            outcome = queue.get_nowait()
+            try:
+                outcome = queue.get_nowait()
+            except Empty:
+                outcome = 'Child process exited with code {}'.format(
+                    process.exitcode)
         finally:
             # Make sure that the process has terminated
             process.terminate()
@@ -133,11 +171,29 @@ class MemoryLeakAssistant(object):
 def _check_for_memory_leak(function, iterations, slack, queue, args=None):
     assistant = MemoryLeakAssistant()
     try:
-        assistant.assertNoMemoryLeak(function,
-                                     iterations=iterations,
-                                     args=args,
-                                     slack=slack)
+        assistant.assertReturnsMemory(function,
+                                      iterations=iterations,
+                                      args=args,
+                                      slack=slack)
     except Exception as error:
         queue.put(error)
         return
     queue.put('FINISHED')
+
+
+def _statm_rss(pid):
+    """ Return the resident set size in bytes of the process as reported in
+    ``/proc/<pid>/statm`` or None if the file cannot be read.
+
+    """
+    try:
+        fd = os.open('/proc/{}/statm'.format(pid), os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        fields = os.pread(fd, 64, 0).split()
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+    return int(fields[1]) * _PAGESIZE
@@ -0,0 +1,111 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import errno
+import os
+import subprocess
+import time
+import unittest
+from unittest import mock
+
+from erinyes.gui import application_test_assistant
+from erinyes.gui.application_test_assistant import ApplicationTestAssistant
+
+
+@unittest.skipUnless(os.name == 'posix', 'requires a POSIX platform')
+class TestAssertProcessDoesNotExist(ApplicationTestAssistant,
+                                    unittest.TestCase):
+
+    def start(self, seconds):
+        process = subprocess.Popen(['sleep', str(seconds)])
+        self.addCleanup(process.wait)
+        self.addCleanup(process.kill)
+        return process
+
+    def test_returns_when_process_exits(self):
+        process = self.start(0.2)
+        start = time.monotonic()
+        self.assertProcessDoesNotExist(process, timeout=5.0)
+        self.assertLess(time.monotonic() - start, 2.0)
+
+    def test_running_process_fails_within_timeout(self):
+        process = self.start(10)
+        start = time.monotonic()
+        with self.assertRaises(AssertionError):
+            self.assertProcessDoesNotExist(process, timeout=0.3)
+        elapsed = time.monotonic() - start
+        self.assertGreaterEqual(elapsed, 0.3)
+        self.assertLess(elapsed, 2.0)
+
+    def test_exited_process(self):
+        process = self.start(0)
+        # Wait for the exit without reaping the child.
+        os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT)
+        start = time.monotonic()
+        self.assertProcessDoesNotExist(process, timeout=5.0)
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_fallback_without_pidfd_support(self):
+        error = OSError(errno.ENOSYS, 'Function not implemented')
+        process = self.start(10)
+        with mock.patch.object(os, 'pidfd_open', side_effect=error,
+                               create=True), \
+                mock.patch.object(application_test_assistant.time,
+                                  'sleep') as sleep:
+            with self.assertRaises(AssertionError):
+                self.assertProcessDoesNotExist(process, timeout=0.3)
+        sleep.assert_called_once_with(0.3)
+
+    def test_fallback_without_pidfd_open(self):
+        if hasattr(application_test_assistant.select, 'kqueue'):
+            self.skipTest('kqueue is used when pidfd_open is missing')
+        if hasattr(os, 'pidfd_open'):
+            pidfd_open = os.pidfd_open
+            del os.pidfd_open
+            self.addCleanup(setattr, os, 'pidfd_open', pidfd_open)
+        process = self.start(10)
+        with mock.patch.object(application_test_assistant.time,
+                               'sleep') as sleep:
+            with self.assertRaises(AssertionError):
+                self.assertProcessDoesNotExist(process, timeout=0.3)
+        sleep.assert_called_once_with(0.3)
+
+
+@unittest.skipUnless(os.name == 'posix', 'requires a POSIX platform')
+class TestStartApplication(ApplicationTestAssistant, unittest.TestCase):
+
+    def start_application(self, *args, **kwargs):
+        process = super(TestStartApplication, self).start_application(
+            *args, **kwargs)
+        self.addCleanup(process.wait)
+        self.addCleanup(process.kill)
+        return process
+
+    def test_string_command_with_arguments(self):
+        process = self.start_application('sleep 0.1')
+        self.assertEqual(process.wait(), 0)
+
+    def test_list_command(self):
+        process = self.start_application(['sh', '-c', 'exit 3'])
+        self.assertEqual(process.wait(), 3)
+
+    def test_output_defaults_to_devnull(self):
+        with mock.patch.object(
+                application_test_assistant.subprocess, 'Popen') as popen:
+            ApplicationTestAssistant().start_application(['true'])
+        kwargs = popen.call_args[1]
+        self.assertIs(kwargs['stdout'], subprocess.DEVNULL)
+        self.assertIs(kwargs['stderr'], subprocess.DEVNULL)
+
+    def test_new_session(self):
+        process = self.start_application(['sleep', '10'], new_session=True)
+        self.assertEqual(os.getsid(process.pid), process.pid)
+
+    def test_same_session_by_default(self):
+        process = self.start_application(['sleep', '10'])
+        self.assertEqual(os.getsid(process.pid), os.getsid(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
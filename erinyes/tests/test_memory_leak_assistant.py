@@ -0,0 +1,62 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import os
+import subprocess
+import sys
+import unittest
+
+import psutil
+
+from erinyes.stress.memory_leak_assistant import (
+    MemoryLeakAssistant, _statm_rss)
+
+_retained = []
+
+
+def _no_leak():
+    [0] * 1000
+
+
+def _leak():
+    _retained.append(bytearray(10 ** 6))
+
+
+class TestMemoryLeakAssistant(MemoryLeakAssistant, unittest.TestCase):
+
+    def test_returns_memory_calls_function(self):
+        calls = []
+        self.assertReturnsMemory(
+            calls.append, args=(None,), iterations=23, sample_every=10)
+        self.assertEqual(len(calls), 23)
+
+    def test_returns_memory_with_invalid_sample_every(self):
+        for sample_every in (0, -3):
+            with self.assertRaises(ValueError):
+                self.assertReturnsMemory(_no_leak, sample_every=sample_every)
+
+    def test_does_not_leak(self):
+        self.assertDoesNotLeak(_no_leak)
+
+    def test_does_not_leak_with_leaking_function(self):
+        with self.assertRaisesRegex(AssertionError, 'Memory leak'):
+            self.assertDoesNotLeak(_leak)
+
+
+@unittest.skipUnless(sys.platform.startswith('linux'), 'requires Linux')
+class TestStatmRss(unittest.TestCase):
+
+    def test_matches_psutil(self):
+        expected = psutil.Process().memory_info().rss
+        rss = _statm_rss(os.getpid())
+        self.assertAlmostEqual(rss, expected, delta=expected * 0.1)
+
+    def test_missing_process(self):
+        process = subprocess.Popen(['true'])
+        process.wait()
+        self.assertIsNone(_statm_rss(process.pid))
+
+
+if __name__ == '__main__':
+    unittest.main()